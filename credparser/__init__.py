@@ -20,14 +20,43 @@ if os.environ.get('CREDPARSER_DEBUG'):
     _pkg_logger.setLevel(logging.DEBUG)
     _pkg_logger.addHandler(_handler)
 
-# Load and trigger configuration processing
-from .config import config
-
 # Expose credparser errors in base namespace
-from .errors import *
+from .errors import (
+    credparserError,
+    CryptError,
+    UsageError,
+    InitFailure,
+    DecodeFailure,
+    EncodeFailure,
+    ConfigError,
+    InvalidDataType,
+)
 
 # Main CredParser class object
 from .credparser import CredParser
 
+# Configuration singleton is resolved on first access through __getattr__
+#   - Importing the submodules binds credparser.config to the config module,
+#     drop that binding so the attribute keeps pointing at the singleton
+globals().pop('config', None)
+
 # Interactive credential creation guide
-from .guide import make_credentials, configure_credparser
+#   - Loaded on first access (PEP 562) so decode-only importers do not pay
+#     for the CLI dependencies (argparse, getpass)
+_LAZY_GUIDE_ATTRS = ('make_credentials', 'configure_credparser')
+
+
+def __getattr__(name):
+    if name == 'config':
+        from .config import get_config
+        return get_config()
+    if name in _LAZY_GUIDE_ATTRS:
+        from . import guide
+        value = getattr(guide, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | {'config', *_LAZY_GUIDE_ATTRS})
@@ -57,24 +57,25 @@ def main():
     print()
 
     try:
-        choice = input('Enter selection [1/2/q]: ').strip().lower()
-
-        if choice == '1':
-            _logger.debug('User selected: make_credentials')
-            make_credentials()
-        elif choice == '2':
-            _logger.debug('User selected: configure_credparser_cli')
-            configure_credparser_cli()
-        elif choice == 'q':
-            _logger.debug('User quit menu')
-            print()
-            sys.exit(0)
-        else:
-            print()
-            print('Invalid selection. Please enter 1, 2, or q.')
-            print()
-            # Recursively call main for retry
-            main()
+        while True:
+            choice = input('Enter selection [1/2/q]: ').strip().lower()
+
+            if choice == '1':
+                _logger.debug('User selected: make_credentials')
+                make_credentials()
+            elif choice == '2':
+                _logger.debug('User selected: configure_credparser_cli')
+                configure_credparser_cli()
+            elif choice == 'q':
+                _logger.debug('User quit menu')
+                print()
+                sys.exit(0)
+            else:
+                print()
+                print('Invalid selection. Please enter 1, 2, or q.')
+                print()
+                continue
+            break
 
     except KeyboardInterrupt:
         print()
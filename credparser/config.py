@@ -12,6 +12,7 @@ Config settings:
     MAX_HASH_ROUNDS = <Maximum number of key-gen hash rounds>
     MIN_HASH_ROUNDS = <Minimum number of key-gen hash rounds>
 '''
+import functools
 import logging
 from dataclasses import dataclass
 from pathlib import Path
@@ -51,6 +52,9 @@ class CredParserConfig:
         min_hash_rounds: Minimum number of key-gen hash rounds (must be >= 1)
         config_file: Path to config file used (for reference/debugging)
     '''
+    # Explicit __slots__ (dataclass slots=True needs Python 3.10+)
+    __slots__ = ('salt_len', 'max_hash_rounds', 'min_hash_rounds', 'config_file')
+
     salt_len: int
     max_hash_rounds: int
     min_hash_rounds: int
@@ -84,35 +88,54 @@ def _read_config_file(config_file: Path) -> dict:
     '''
     Reads the specified config file and returns a dictionary of all
     key = value lines found in the config file.
+
+    Parsed results are cached by (resolved path, mtime, size) so repeated
+    loads of an unchanged file skip the disk read.
     '''
-    if config_file is None or not Path(config_file).exists():
+    if config_file is not None and not isinstance(config_file, Path):
+        config_file = Path(config_file)
+    if config_file is None or not config_file.exists():
         _logger.debug(f'Config file not found: {config_file}')
         return {}
 
-    _logger.debug(f'Reading config file: {config_file}')
     try:
-        settings = {}
-        with open(config_file, 'r') as f:
-            lines = [
-                line.strip() for line in f.readlines()
-                if '=' in line and not line.startswith('#')
-            ]
-        for line in lines:
-            key, value = [s.strip() for s in line.split('=')]
-            key = key.lower()
-            value = value.strip('\'"')
-            if value.isdigit():
-                value = int(value)
-            settings[key] = value
-            _logger.debug(f'Config file setting: {key}={value}')
-
-        return settings
+        config_path = config_file.resolve()
+        file_stat = config_path.stat()
+        return dict(_parse_config_file(
+            str(config_path), file_stat.st_mtime_ns, file_stat.st_size
+        ))
 
     except (OSError, PermissionError) as e:
         errmsg = f'Unable to read configuration file {config_file}: {e}'
         raise ConfigError(errmsg)
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(config_file: str, mtime_ns: int, size: int) -> dict:
+    '''
+    Parse the config file contents; mtime_ns and size only act as cache keys.
+    Callers receive a copy via _read_config_file().
+    '''
+    _logger.debug(f'Reading config file: {config_file}')
+    settings = {}
+    # Single read of the (small) file, then parse from memory
+    for raw in Path(config_file).read_text().splitlines():
+        line = raw.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, _, value = line.partition('=')
+        key = key.strip().lower()
+        value = value.strip().strip('\'"')
+        try:
+            value = int(value)
+        except ValueError:
+            pass
+        settings[key] = value
+        _logger.debug(f'Config file setting: {key}={value}')
+
+    return settings
+
+
 def _resolve_value(arg_value, config_value, default_value):
     '''Returns the highest priority value: arg > config file > default.'''
     if arg_value is not None:
@@ -148,7 +171,8 @@ def load_config(
     Raises:
         ConfigError: Invalid configuration values
     '''
-    config_path = Path(config_file or CREDPARSER_CONFIG_FILE)
+    config_file = config_file or CREDPARSER_CONFIG_FILE
+    config_path = config_file if isinstance(config_file, Path) else Path(config_file)
     _logger.debug(f'Loading config from: {config_path}')
 
     file_settings = _read_config_file(config_path)
@@ -186,4 +210,23 @@ def load_config(
 # =============================================================================
 # Module-level Singleton
 # =============================================================================
-config = load_config()
+_config = None
+
+
+def get_config() -> CredParserConfig:
+    '''
+    Return the module-level configuration singleton, loading it on first use.
+
+    Importers that never encode/decode skip the config file read entirely.
+    '''
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+
+def __getattr__(name):
+    # Keep `from .config import config` working via the lazy singleton (PEP 562)
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -4,14 +4,73 @@ credparser / credparser.py
 Main CredParser class definitions
 '''
 import logging
-from .errors import *
-from .mutators import _encode_credentials, _decode_credentials
+from .errors import UsageError, DecodeFailure
+from .mutators import (
+    _encode_credentials, _encode_many, _decode_credentials, _decode_many
+)
 from pathlib import Path
+from typing import Iterable, List, Tuple
 
 _logger = logging.getLogger(__name__)
 
-# Setup the default master.seed file path based on user Home directory
-DEFAULT_SEED_FILE = Path().home() / '.credparser/master.seed'
+# Default master.seed file path based on user Home directory
+#   - Resolved on first use so callers passing seed_path skip Path.home()
+_DEFAULT_SEED_FILE = None
+
+
+def _default_seed_file() -> Path:
+    ''' Return the default master.seed path, computing it once '''
+    global _DEFAULT_SEED_FILE
+    if _DEFAULT_SEED_FILE is None:
+        _DEFAULT_SEED_FILE = Path.home() / '.credparser/master.seed'
+    return _DEFAULT_SEED_FILE
+
+
+def __getattr__(name):
+    # Keep DEFAULT_SEED_FILE importable for existing callers (PEP 562)
+    if name == 'DEFAULT_SEED_FILE':
+        return _default_seed_file()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def _resolve_seed_path(seed_path) -> Path:
+    ''' Return seed_path as a Path, skipping the re-wrap of existing Paths '''
+    if seed_path is None:
+        return _default_seed_file()
+    if isinstance(seed_path, Path):
+        return seed_path
+    return Path(seed_path)
+
+
+def _validate_args(username: str, password: str, credentials: str) -> None:
+    ''' Verify the username/password/credentials argument combination '''
+    # Username and password must either be both set or None
+    if (username is None) != (password is None):
+        raise UsageError('username and password must be either set or None')
+
+    # Credential string cannot be manually set with username and password
+    if (username or password) and credentials:
+        raise UsageError('Cannot set username and password with a credential string')
+
+    # Validate username and password are ASCII compatible
+    _validate_user_pass(username, password)
+
+
+def _validate_user_pass(username: str, password: str) -> None:
+    ''' Verify username/password values are ASCII and within length limits '''
+    if username is not None:
+        if not username.isascii():
+            raise UsageError('username must contain only ASCII characters')
+        if len(username) > 255:
+            raise UsageError('username must be 255 characters or less')
+
+    if password is not None and not password.isascii():
+        raise UsageError('password must contain only ASCII characters')
+
+
+# Decoded (username, password) placeholder for an uninitialized CredParser
+_UNDECODED = (None, None)
+
 
 class CredParser():
     '''
@@ -37,6 +96,12 @@ class CredParser():
         >>> parser = CredParser(credentials='encoded_string')
         >>> parser = CredParser()  # Initialize empty
     '''
+    __slots__ = ('_credentials', '_decoded', '_signer', '_seed_path')
+    _credentials: str
+    _decoded: Tuple[str, str]
+    _signer: str
+    _seed_path: Path
+
     def __init__(self,
         username: str = None,
         password: str = None,
@@ -46,40 +111,13 @@ class CredParser():
     ):
         _logger.debug('CredParser init')
 
-        # Username and password must either be both set or None
-        if (
-            (username is not None and password is None)
-            or (username is None and password is not None)
-        ):
-            errmsg = 'username and password must be either set or None'
-            raise UsageError(errmsg)
-
-        # Credential string cannot be manually set with username and password
-        if (username or password) and credentials:
-            errmsg = 'Cannot set username and password with a credential string'
-            raise UsageError(errmsg)
-
-        # Validate username and password are ASCII compatible
-        if username is not None:
-            try:
-                username.encode('ascii')
-            except UnicodeEncodeError:
-                raise UsageError('username must contain only ASCII characters')
-            if len(username) > 255:
-                raise UsageError('username must be 255 characters or less')
-
-        if password is not None:
-            try:
-                password.encode('ascii')
-            except UnicodeEncodeError:
-                raise UsageError('password must contain only ASCII characters')
+        _validate_args(username, password, credentials)
 
         self._credentials = credentials
-        self.signer = signer
+        self._decoded = _UNDECODED
+        self._signer = signer
 
-        self.seed_path = (
-            Path(seed_path) if seed_path is not None else DEFAULT_SEED_FILE
-        )
+        self._seed_path = _resolve_seed_path(seed_path)
 
         if username is not None and password is not None:
             _logger.debug('Generating credentials from username/password')
@@ -87,8 +125,8 @@ class CredParser():
             self._credentials = _encode_credentials(
                 username=username,
                 password=password,
-                signer=self.signer,
-                seed_path=self.seed_path
+                signer=self._signer,
+                seed_path=self._seed_path
             )
         elif credentials:
             _logger.debug('Initializing with credential string')
@@ -97,26 +135,28 @@ class CredParser():
 
         if self._credentials:
             # Credential string verification for either auto-gen or argument
+            #   - decoded values are kept to serve username/password lookups
             try:
-                _, _ = _decode_credentials(
+                self._decoded = _decode_credentials(
                     self._credentials,
-                    signer=self.signer,
-                    seed_path=self.seed_path
+                    signer=self._signer,
+                    seed_path=self._seed_path
                 )
                 _logger.debug('Credential string validated')
             except DecodeFailure as e:
                 raise DecodeFailure(e) from None
 
     def __repr__(self):
-        if self._credentials is None:
+        if self._decoded is _UNDECODED:
             details = '<uninitialized>'
         else:
+            username, password = self._decoded
             details = (
-                f'credentials=\'{self.credentials}\', '
-                f'username=\'{self.username}\', '
-                f'password={"*"*len(self.password)}, '
-                f'signer={self.signer!r}, '
-                f'seed_path={str(self.seed_path)}'
+                f'credentials=\'{self._credentials}\', '
+                f'username=\'{username}\', '
+                f'password={"*"*len(password)}, '
+                f'signer={self._signer!r}, '
+                f'seed_path={str(self._seed_path)}'
             )
         return f'CredParser({details})'
 
@@ -134,53 +174,125 @@ class CredParser():
         '''
         return self._credentials
 
+    @property
+    def signer(self) -> str:
+        '''
+        Get the custom signer used for key derivation.
+
+        Returns:
+            str: Signer value or None when the OS username is used
+        '''
+        return self._signer
+
+    @property
+    def seed_path(self) -> Path:
+        '''
+        Get the master.seed file location used for key derivation.
+
+        Returns:
+            Path: master.seed file path
+        '''
+        return self._seed_path
+
     @property
     def username(self) -> str:
         '''
-        Extract username from credential string.
+        Get the username decoded from the credential string.
+
+        Decoding happens once when credentials are set or loaded, subsequent
+        reads return the cached value.
 
         Returns:
             str: Decoded username or None if no credentials loaded
-
-        Raises:
-            DecodeFailure: Credential string cannot be decoded
         '''
-        if self._credentials is None:
-            return None
-        try:
-            username, _ = _decode_credentials(
-                self._credentials,
-                signer=self.signer,
-                seed_path=self.seed_path
-            )
-        except DecodeFailure as e:
-            raise DecodeFailure(e) from None
-        return username
+        return self._decoded[0]
 
 
     @property
     def password(self) -> str:
         '''
-        Extract password from credential string.
+        Get the password decoded from the credential string.
+
+        Decoding happens once when credentials are set or loaded, subsequent
+        reads return the cached value.
 
         Returns:
             str: Decoded password or None if no credentials loaded
+        '''
+        return self._decoded[1]
+
+
+    @classmethod
+    def bulk_decode(
+        cls,
+        credentials: Iterable[str],
+        signer: str = None,
+        seed_path: Path = None
+    ) -> List[Tuple[str, str]]:
+        '''
+        Decode many credential strings sharing the same signer and seed.
+
+        The master.seed file is loaded once for the whole batch, avoiding the
+        per-instance setup of constructing a CredParser for each string.
+
+        Args:
+            credentials (Iterable[str]): Encoded credential strings
+            signer (str, optional): Custom signer, defaults to OS username
+            seed_path (Path, optional): Alternative master.seed file location
+
+        Returns:
+            list: (username, password) tuples in input order
 
         Raises:
-            DecodeFailure: Credential string cannot be decoded
+            DecodeFailure: Any credential string cannot be decoded
         '''
-        if self._credentials is None:
-            return None
+        _logger.debug('Bulk decoding credential strings')
         try:
-            _, password = _decode_credentials(
-                self._credentials,
-                signer=self.signer,
-                seed_path=self.seed_path
+            return _decode_many(
+                credentials,
+                signer=signer,
+                seed_path=_resolve_seed_path(seed_path)
             )
         except DecodeFailure as e:
             raise DecodeFailure(e) from None
-        return password
 
+    @classmethod
+    def bulk_encode(
+        cls,
+        pairs: Iterable[Tuple[str, str]],
+        signer: str = None,
+        seed_path: Path = None
+    ) -> List[str]:
+        '''
+        Encode many username/password pairs sharing the same signer and seed.
+
+        The master.seed file is loaded and salt entropy drawn once for the
+        whole batch, avoiding the per-instance setup and verification decode
+        of constructing a CredParser for each pair.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): (username, password) tuples
+            signer (str, optional): Custom signer, defaults to OS username
+            seed_path (Path, optional): Alternative master.seed file location
+
+        Returns:
+            list: Credential strings in input order
+
+        Raises:
+            UsageError: Invalid username or password values
+            EncodeFailure: Internal encoding failure
+        '''
+        _logger.debug('Bulk encoding credential pairs')
+        pairs = list(pairs)
+        for username, password in pairs:
+            if username is None or password is None:
+                raise UsageError('username and password must be set for every pair')
+            _validate_user_pass(username, password)
+        return _encode_many(
+            pairs,
+            signer=signer,
+            seed_path=_resolve_seed_path(seed_path)
+        )
 
     def load(self, credentials: str):
         '''
@@ -193,30 +305,48 @@ class CredParser():
             DecodeFailure: Credential string cannot be decoded
         '''
         _logger.debug('Loading credential string')
-        self._credentials = credentials
         try:
-            _, _ = _decode_credentials(
-                self._credentials,
-                signer=self.signer,
-                seed_path=self.seed_path
+            decoded = _decode_credentials(
+                credentials,
+                signer=self._signer,
+                seed_path=self._seed_path
             )
             _logger.debug('Credential string loaded and validated')
         except DecodeFailure as e:
             raise DecodeFailure(e) from None
+        # Only replace state once the new string is known to decode
+        self._credentials = credentials
+        self._decoded = decoded
 
     def reset(self, username: str, password: str, signer: str = None):
         '''
         Reinitialize with new username/password pair.
 
+        Passing None for both username and password clears the parser back
+        to the uninitialized state of CredParser().
+
         Args:
             username (str): New username
             password (str): New password
             signer (str, optional): New signer
+
+        Raises:
+            UsageError: Invalid username or password values
         '''
         _logger.debug('Resetting credentials')
-        self.__init__(
+        _validate_args(username, password, None)
+        if username is None and password is None:
+            # Matches CredParser() with no arguments: back to uninitialized
+            self._credentials = None
+            self._decoded = _UNDECODED
+            self._signer = signer
+            return
+        # Values are known-good, so skip the verification decode
+        self._credentials = _encode_credentials(
             username=username,
             password=password,
             signer=signer,
-            seed_path=self.seed_path
+            seed_path=self._seed_path
         )
+        self._decoded = (username, password)
+        self._signer = signer
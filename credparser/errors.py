@@ -1,6 +1,16 @@
 '''
 credparser / errors
 '''
+__all__ = [
+    'credparserError',
+    'CryptError',
+    'UsageError',
+    'InitFailure',
+    'DecodeFailure',
+    'EncodeFailure',
+    'ConfigError',
+    'InvalidDataType',
+]
 
 class credparserError(Exception):
     ''' Generic credparserError exception class '''
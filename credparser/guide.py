@@ -10,7 +10,7 @@ import sys
 import argparse
 from pathlib import Path
 
-from .credparser import CredParser, DEFAULT_SEED_FILE
+from .credparser import CredParser, _default_seed_file
 from .config import (
     CREDPARSER_CONFIG_FILE,
     DEFAULT_SALT_LEN,
@@ -280,9 +280,10 @@ def configure_credparser(
             print()
 
             # Check for existing master.seed and warn user
-            if DEFAULT_SEED_FILE.exists():
+            seed_file = _default_seed_file()
+            if seed_file.exists():
                 print("WARNING: A master.seed file exists at:")
-                print(f"  {DEFAULT_SEED_FILE}")
+                print(f"  {seed_file}")
                 print()
                 print("Changing configuration values will cause ALL previously")
                 print("encoded credentials to fail decoding.")
@@ -4,36 +4,83 @@ credparser / mutators
 Manipulators for data encoding and decoding
 
 '''
+import functools
 import logging
-from .config import config
-from .seed import MasterSeed
-from .errors import *
+from .config import get_config
+from .seed import MasterSeed, seed_digest
+from .errors import DecodeFailure, EncodeFailure, InvalidDataType
 
 import getpass
-import hashlib
-import base64
+from hashlib import sha512 as _sha512
+import hmac
+from binascii import a2b_base64, b2a_base64
+import re
 import secrets
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Tuple
 from pathlib import Path
 
 _logger = logging.getLogger(__name__)
 
+# Shape of a credential string: salt grains and base64 alphabet, with at
+#   most two padding characters and only at the end, plus whitespace which
+#   base64 decoding has always ignored (e.g. a trailing newline from a file)
+_CREDENTIAL_RE = re.compile(r'[A-Za-z0-9+/\s]*(?:=\s*){0,2}', re.ASCII)
+
+
+def _bitrev8(x: int) -> int:
+    ''' Branchless 8-bit reversal: spread, mask and gather with multiplies '''
+    return ((x * 0x80200802) & 0x0884422110) * 0x0101010101 >> 32 & 0xff
+
+
+# Bit-reversal lookup for every byte value, applied with bytes.translate()
+BITREV_TABLE = bytes(_bitrev8(i) for i in range(256))
+
 
 def binflip(invalue: int) -> int:
     ''' Reverse the bit order inside a byte '''
-    return int('{:08b}'.format(invalue)[::-1], 2)
+    return BITREV_TABLE[invalue]
 
-def nacl(length: int) -> str:
-    ''' Salt generation / Using conf friendly characters '''
-    grains = (
-        "0123456789"
-        "abcdefghijklmnopqrstuvwxyz"
-        "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-    )
-    return ''.join(secrets.choice(grains) for _ in range(length))
 
+# Salt grains - conf friendly characters
+_GRAINS = (
+    b"0123456789"
+    b"abcdefghijklmnopqrstuvwxyz"
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+# Largest multiple of len(_GRAINS) within a byte, random bytes at or above
+#   this are rejected so every grain stays equally likely
+_GRAINS_LIMIT = 256 - (256 % len(_GRAINS))
 
-def generate_key(master_seed: bytes, salt: str, signer: str) -> bytes:
+
+def nacl(length: int) -> str:
+    ''' Salt generation / Using conf friendly characters '''
+    salt = bytearray()
+    while len(salt) < length:
+        # Draw the entropy in bulk, with headroom for rejected bytes
+        for b in secrets.token_bytes(length - len(salt) + 8):
+            if b < _GRAINS_LIMIT:
+                salt.append(_GRAINS[b % len(_GRAINS)])
+                if len(salt) == length:
+                    break
+    return salt.decode('ascii')
+
+
+# Derived keys, least recently used first. Keyed on the seed digest rather
+#   than the seed, plus salt, signer and hash round limits, so a different
+#   config can never be served a key derived under other settings
+_KEY_CACHE: 'OrderedDict[tuple, bytes]' = OrderedDict()
+_KEY_CACHE_SIZE = 128
+_KEY_CACHE_LOCK = threading.Lock()
+
+
+def generate_key(
+    master_seed: bytes,
+    salt: str,
+    signer: str,
+    digest: bytes = None
+) -> bytes:
     '''
     Generate a unique key using the master seed, salt, and signer.
 
@@ -42,40 +89,103 @@ def generate_key(master_seed: bytes, salt: str, signer: str) -> bytes:
     Key generation workflow:
       TRANSFORM: master seed is XORed with repeating salt/signer pattern
       HASH ROUNDS: salt determines a set number of hash rounds for key
+
+    Keys are memoized per seed/salt/signer; pass the seed digest held by
+      MasterSeed to skip fingerprinting the seed here.
     '''
-    _logger.debug(f'Entered generate_key() with {signer=}')
-    salt_bytes = str(salt).encode('ascii')
-    signer_bytes = str(signer).encode('ascii')
+    _logger.debug('Entered generate_key() with signer=%r', signer)
+    cfg = get_config()
+    if digest is None:
+        digest = seed_digest(master_seed)
+    cache_key = (
+        digest, str(salt), str(signer),
+        cfg.min_hash_rounds, cfg.max_hash_rounds
+    )
+    with _KEY_CACHE_LOCK:
+        key = _KEY_CACHE.get(cache_key)
+        if key is not None:
+            _KEY_CACHE.move_to_end(cache_key)
+            return key
+
+    key = _derive_key(
+        bytes(master_seed),
+        str(salt),
+        str(signer),
+        cfg.min_hash_rounds,
+        cfg.max_hash_rounds
+    )
+    with _KEY_CACHE_LOCK:
+        _KEY_CACHE[cache_key] = key
+        if len(_KEY_CACHE) > _KEY_CACHE_SIZE:
+            _KEY_CACHE.popitem(last=False)
+    return key
+
+
+def _derive_key(
+    master_seed: bytes,
+    salt: str,
+    signer: str,
+    min_hash_rounds: int,
+    max_hash_rounds: int
+) -> bytes:
+    ''' Key derivation for generate_key() '''
+    salt_bytes = salt.encode('ascii')
+    signer_bytes = signer.encode('ascii')
+    pattern = salt_bytes + signer_bytes
 
     # Transform: XOR master_seed with repeated salt+username pattern
-    pattern = (
-        (salt_bytes + signer_bytes) *
-        ((len(master_seed) // len(salt_bytes + signer_bytes)) + 1)
-    )
-    # Clip pattern to length of master_seed and XOR
-    pattern = pattern[:len(master_seed)]
-    transformed = bytes(a ^ b for a, b in zip(master_seed, pattern))
+    transformed = key_filter(master_seed, pattern)
 
     # Determine hash rounds from salt
-    salt_int = sum(ord(c) for c in salt)
+    salt_int = sum(salt_bytes)
     hash_rounds = (
-        (salt_int % config.max_hash_rounds)
-        if (salt_int % config.max_hash_rounds) > config.min_hash_rounds
-        else config.min_hash_rounds
+        (salt_int % max_hash_rounds)
+        if (salt_int % max_hash_rounds) > min_hash_rounds
+        else min_hash_rounds
     )
 
     # Multiple hash rounds for additional transformation
-    result = transformed
-    for _ in range(hash_rounds):
-        result = hashlib.sha512(result + salt_bytes + signer_bytes).digest()
+    return _hash_rounds(transformed, pattern, hash_rounds)
 
+
+def _hash_rounds(data: bytes, tail: bytes, rounds: int) -> bytes:
+    '''
+    Chained sha512 rounds over data, appending the fixed tail to each round.
+
+    The tail (salt + signer) is built once by the caller and fed to each round
+    with update(), avoiding a digest + tail concatenation per round.
+    '''
+    result = data
+    for _ in range(rounds):
+        h = _sha512(result)
+        h.update(tail)
+        result = h.digest()
     return result
 
 
+def _tile(pattern: bytes, n: int) -> bytes:
+    ''' Repeat pattern to exactly n bytes without an oversized intermediate '''
+    # Short data (e.g. a decode of a small credential) only needs a slice
+    if n <= len(pattern):
+        return pattern[:n]
+    whole, part = divmod(n, len(pattern))
+    return pattern * whole + pattern[:part]
+
+
 def key_filter(data: bytes, key: bytes) -> bytes:
     ''' XOR the data against the key '''
-    extended_key = (key * ((len(data) // len(key)) + 1))[:len(data)]
-    return bytes(a ^ b for a, b in zip(data, extended_key))
+    n = len(data)
+    extended_key = _tile(key, n)
+    # Single wide-integer XOR runs in C instead of a per-byte Python loop
+    return (
+        int.from_bytes(data, 'big') ^ int.from_bytes(extended_key, 'big')
+    ).to_bytes(n, 'big')
+
+
+@functools.lru_cache(maxsize=1)
+def _os_signer() -> str:
+    ''' Default signer: the OS username, looked up once per process '''
+    return getpass.getuser()
 
 
 def _encode_credentials(
@@ -88,15 +198,74 @@ def _encode_credentials(
     Encode is wrapped to provide error handling and catching for data types
     '''
     _logger.debug('Encoding credentials')
+    # Load config up front so an invalid .config raises ConfigError here
+    #   rather than being wrapped as an encode/decode failure below
+    get_config()
     master_seed = MasterSeed(allow_init=True, seed_path=seed_path)
 
     if not isinstance(username, str) or not isinstance(password, str):
         raise InvalidDataType()
 
+    return _encode_wrapped(
+        master_seed.seed, username, password, signer,
+        digest=master_seed.digest
+    )
+
+
+def _encode_many(
+    pairs: Iterable[Tuple[str, str]],
+    signer: str = None,
+    seed_path: Path = None,
+) -> List[str]:
+    '''
+    Encode several username/password pairs sharing one seed and signer.
+
+    The master seed is loaded, the signer resolved, and the salt entropy for
+      every pair drawn once for the whole batch rather than per pair.
+    '''
+    _logger.debug('Bulk encoding credentials with signer=%r', signer)
+    # Load config up front so an invalid .config raises ConfigError here
+    #   rather than being wrapped as an encode/decode failure below
+    salt_len = get_config().salt_len
+    master_seed = MasterSeed(allow_init=True, seed_path=seed_path)
+
+    pairs = list(pairs)
+    for username, password in pairs:
+        if not isinstance(username, str) or not isinstance(password, str):
+            raise InvalidDataType()
+
+    seed = master_seed.seed
+    digest = master_seed.digest
+    if signer is None:
+        signer = _os_signer()
+    salts = nacl(salt_len * len(pairs))
+
+    return [
+        _encode_wrapped(
+            seed, username, password, signer,
+            salt=salts[i * salt_len:(i + 1) * salt_len],
+            digest=digest
+        )
+        for i, (username, password) in enumerate(pairs)
+    ]
+
+
+def _encode_wrapped(
+    master_seed: bytes,
+    username: str,
+    password: str,
+    signer: str = None,
+    salt: str = None,
+    digest: bytes = None,
+) -> str:
+    ''' Encode, mapping any failure to EncodeFailure '''
     # Catch all Exceptions during encode so we can provide a reliable
     #   exception for importers when this fails: EncodeFailure()
     try:
-        result = encode(master_seed.seed, username, password, signer)
+        result = encode(
+            master_seed, username, password, signer,
+            salt=salt, digest=digest
+        )
         _logger.debug('Credentials encoded successfully')
         return result
     except Exception as e:
@@ -111,34 +280,63 @@ def encode(
     master_seed: bytes,
     username: str,
     password: str,
-    signer: str = None
+    signer: str = None,
+    salt: str = None,
+    digest: bytes = None
 ) -> str:
     # Set signer to current OS username if not specified
     if signer is None:
-        signer = getpass.getuser()
+        signer = _os_signer()
 
-    salt = nacl(config.salt_len)
-    _logger.debug(f'Generating key for encode with {signer=}')
-    key = generate_key(master_seed, salt, signer)
+    # Bulk callers pass a pre-drawn salt, otherwise draw a fresh one
+    if salt is None:
+        salt = nacl(get_config().salt_len)
+    _logger.debug('Generating key for encode with signer=%r', signer)
+    key = generate_key(master_seed, salt, signer, digest)
 
     # Build message as bytes - username/password encoded to ASCII at boundary
     username_bytes = username.encode('ascii')
     password_bytes = password.encode('ascii')
-    message = (
-        salt.encode('ascii') +
-        bytes([len(username_bytes)]) +
-        username_bytes +
-        password_bytes
-    )
+    # Single join sizes the result once instead of chaining concatenations
+    message = b''.join((
+        salt.encode('ascii'),
+        bytes((len(username_bytes),)),
+        username_bytes,
+        password_bytes,
+    ))
 
     # Apply binflip transformation on raw bytes
-    egassem = bytes(binflip(b) for b in message)
+    egassem = message.translate(BITREV_TABLE)
     egassem_cipher = key_filter(egassem, key)
 
-    cipher_b64 = base64.b64encode(egassem_cipher).decode('ascii')
+    cipher_b64 = b2a_base64(egassem_cipher, newline=False).decode('ascii')
     return salt + cipher_b64
 
 
+def _validate_credential_string(credential_string: str) -> None:
+    '''
+    Cheap structural check run before key derivation.
+
+    Rejects values that cannot be a credential string (wrong type, salt not
+    made of grains, malformed base64 body, or too short to hold the encrypted
+    salt and username length byte) without paying for the seed transform and
+    hash rounds.
+    '''
+    if (
+        not isinstance(credential_string, str)
+        or _CREDENTIAL_RE.fullmatch(credential_string) is None
+    ):
+        raise DecodeFailure('Invalid credential string, unable to decode')
+    salt_len = get_config().salt_len
+    salt = credential_string[:salt_len]
+    if not (salt.isascii() and salt.isalnum()):
+        raise DecodeFailure('Invalid credential string, unable to decode')
+    # base64 length of the smallest message: salt + username length byte
+    min_cipher_len = 4 * ((salt_len + 1 + 2) // 3)
+    if len(credential_string) - salt_len < min_cipher_len:
+        raise DecodeFailure('Invalid credential string, unable to decode')
+
+
 def _decode_credentials(
     credential_string: str,
     signer: str = None,
@@ -148,12 +346,53 @@ def _decode_credentials(
     Actual decode method is wrapped to provide better error catching and
       handling for decryption failures.
     '''
-    _logger.debug(f'Decoding credentials with {signer=}')
+    _logger.debug('Decoding credentials with signer=%r', signer)
+    # Load config up front so an invalid .config raises ConfigError here
+    #   rather than being wrapped as an encode/decode failure below
+    get_config()
+    master_seed = MasterSeed(allow_init=False, seed_path=seed_path)
+    return _decode_wrapped(
+        master_seed.seed, credential_string, signer, master_seed.digest
+    )
+
+
+def _decode_many(
+    credential_strings: Iterable[str],
+    signer: str = None,
+    seed_path: Path = None,
+) -> List[Tuple[str, str]]:
+    '''
+    Decode several credential strings sharing one seed and signer.
 
+    The master seed is loaded and the signer resolved once for the whole
+      batch rather than per credential string.
+    '''
+    _logger.debug('Bulk decoding credentials with signer=%r', signer)
+    # Load config up front so an invalid .config raises ConfigError here
+    #   rather than being wrapped as an encode/decode failure below
+    get_config()
     master_seed = MasterSeed(allow_init=False, seed_path=seed_path)
+    seed = master_seed.seed
+    digest = master_seed.digest
+    if signer is None:
+        signer = _os_signer()
+    return [
+        _decode_wrapped(seed, s, signer, digest) for s in credential_strings
+    ]
+
 
+def _decode_wrapped(
+    master_seed: bytes,
+    credential_string: str,
+    signer: str = None,
+    digest: bytes = None,
+) -> Tuple[str, str]:
+    ''' Validate and decode, mapping any failure to DecodeFailure '''
     try:
-        result = decode(master_seed.seed, credential_string, signer=signer)
+        _validate_credential_string(credential_string)
+        result = decode(
+            master_seed, credential_string, signer=signer, digest=digest
+        )
         _logger.debug('Credentials decoded successfully')
         return result
     except DecodeFailure as e:
@@ -173,38 +412,40 @@ def _decode_credentials(
 def decode(
     master_seed: bytes,
     credential_string: str,
-    signer: str = None
+    signer: str = None,
+    digest: bytes = None
 ) -> Tuple[str, str]:
     # Extract plain-text Salt and base64 cipher text from credential string
-    salt = credential_string[:config.salt_len]
-    cipher_b64 = credential_string[config.salt_len:]
-    cipher_text = base64.b64decode(cipher_b64)
+    salt_len = get_config().salt_len
+    salt = credential_string[:salt_len]
+    cipher_b64 = credential_string[salt_len:]
+    cipher_text = a2b_base64(cipher_b64)
 
     # Set signer to OS username if not set
     if signer is None:
-        signer = getpass.getuser()
-    _logger.debug(f'Generating key for decode with {signer=}')
-    key = generate_key(master_seed, salt, signer)
+        signer = _os_signer()
+    _logger.debug('Generating key for decode with signer=%r', signer)
+    key = generate_key(master_seed, salt, signer, digest)
 
     # Attempt to decrypt the cipher text
     egassem = key_filter(cipher_text, key)
-    message = bytes(binflip(b) for b in egassem)
+    message = egassem.translate(BITREV_TABLE)
 
     # Data Extraction
     # - Extract raw bytes, then decode username/password to ASCII at boundary
     # - Decryption failures manifest during byte->str decode() as the raw
     #   byte codes will not align with real ASCII byte values
     try:
-        # Extract and verify salt from message
-        msg_salt_bytes = message[:config.salt_len]
-        if salt.encode('ascii') != msg_salt_bytes:
+        # Extract and verify salt from message (constant-time comparison)
+        msg_salt_bytes = message[:salt_len]
+        if not hmac.compare_digest(salt.encode('ascii'), msg_salt_bytes):
             raise DecodeFailure('Invalid credential string, unable to decode')
 
         # Extract username length (single byte, supports 0-255)
-        username_len = message[config.salt_len]
+        username_len = message[salt_len]
 
         # Extract username and password bytes, decode to ASCII at boundary
-        username_start = config.salt_len + 1
+        username_start = salt_len + 1
         username_end = username_start + username_len
         username = message[username_start:username_end].decode('ascii')
         password = message[username_end:].decode('ascii')
@@ -3,16 +3,52 @@ credparser / seed.py
 
 Provider for the master key seed
 '''
+import functools
+import hashlib
 import logging
 import os
-import secrets
 import stat
 from pathlib import Path
+from typing import Tuple
 from .errors import InitFailure
 
 _logger = logging.getLogger(__name__)
 
 
+def seed_digest(seed: bytes) -> bytes:
+    '''
+    Short fingerprint of the seed for use as a cache key.
+
+    The derived-key cache in mutators is keyed on this rather than the seed,
+      so its keys don't hold seed bytes. The seed bytes themselves are still
+      cached by _load_seed().
+    '''
+    return hashlib.blake2b(seed, digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_seed(seed_path: str, mtime_ns: int, size: int) -> Tuple[bytes, bytes]:
+    '''
+    Read the seed file and fingerprint it once per load.
+
+    mtime_ns and size only act as cache invalidation keys
+    '''
+    _logger.debug(f'Reading seed from {seed_path}')
+    with open(seed_path, 'rb') as f:
+        seed_data = f.read()
+    return seed_data, seed_digest(seed_data)
+
+
+def _seed_for(seed_path: Path) -> Tuple[bytes, bytes]:
+    '''
+    Return (seed, digest) for seed_path, re-reading only if the file changed
+    '''
+    # One stat() per lookup; abspath() is string-only, unlike resolve()
+    path = os.path.abspath(seed_path)
+    file_stat = os.stat(path)
+    return _load_seed(path, file_stat.st_mtime_ns, file_stat.st_size)
+
+
 class MasterSeed():
     def __init__(self, allow_init: bool, seed_path: Path):
         '''
@@ -22,20 +58,24 @@ class MasterSeed():
           so attempts to decode without an existing seed will raise
           as an InitFailure exception
         '''
+        self._seed_cache = None
+        self._digest_cache = None
         try:
             self._allow_init = bool(allow_init)
-            self.seed_path = Path(seed_path)
+            self.seed_path = (
+                seed_path if isinstance(seed_path, Path) else Path(seed_path)
+            )
             _logger.debug(
-                f'MasterSeed init: path={self.seed_path}, allow_init={allow_init}'
+                'MasterSeed init: path=%s, allow_init=%s', self.seed_path, allow_init
             )
 
             if self.seed_path.exists():
-                _logger.debug(f'Seed file exists: {self.seed_path}')
+                _logger.debug('Seed file exists: %s', self.seed_path)
                 # Verify that the seed data can be read
                 _ = self.seed
                 return
 
-            _logger.debug(f'Seed file not found: {self.seed_path}')
+            _logger.debug('Seed file not found: %s', self.seed_path)
             # Seed is not available
             if not allow_init:
                 errmsg = (
@@ -65,17 +105,36 @@ class MasterSeed():
 
     @property
     def seed(self) -> bytes:
-        ''' Read and return the master_seed value as bytes '''
-        _logger.debug(f'Reading seed from {self.seed_path}')
+        '''
+        Return the master_seed value as bytes.
+
+        Held on the instance after the first access, so repeated reads skip
+          the seed file stat(); call reload() to pick up a changed file.
+        '''
+        if self._seed_cache is not None:
+            return self._seed_cache
         try:
-            with open(self.seed_path, 'rb') as f:
-                seed_data = f.read()
-            _logger.debug(f'Seed read successfully, {len(seed_data)} bytes')
-            return bytes(seed_data)
+            seed_data, digest = _seed_for(self.seed_path)
+            _logger.debug('Seed loaded, %d bytes', len(seed_data))
+            self._seed_cache = seed_data
+            self._digest_cache = digest
+            return seed_data
 
         except (OSError, PermissionError) as e:
             raise InitFailure(f"Failed to read seed file {self.seed_path}: {e}")
 
+    @property
+    def digest(self) -> bytes:
+        ''' blake2b fingerprint of the seed, used to key derived-key caches '''
+        if self._digest_cache is None:
+            _ = self.seed
+        return self._digest_cache
+
+    def reload(self) -> None:
+        ''' Drop the held seed value so the next access re-reads the file '''
+        self._seed_cache = None
+        self._digest_cache = None
+
 
     def _create_credparser_dir(self) -> None:
         ''' Create the credparse seed storage directory '''
@@ -102,22 +161,22 @@ class MasterSeed():
         seed_path = Path(self.seed_path)
         _logger.warning(f'Initializing new master seed: {seed_path}')
         try:
-            if os.path.exists(seed_path):
-                errmsg = f'Attempting to reinitialize existing seed: {str(self.seed_path)}'
-                raise InitFailure(errmsg)
-
             # Create new seed file
             _logger.debug('Generating 1024 bytes of random seed data')
-            seed_data = secrets.token_bytes(1024)
+            seed_data = os.urandom(1024)
 
-            # Set umask temporarily to ensure secure creation
-            old_umask = os.umask(0o077)
+            # O_EXCL refuses an existing seed without a separate exists()
+            #   check, and the file is created 0o600 rather than via umask
+            _logger.debug(f'Writing seed file: {seed_path}')
             try:
-                _logger.debug(f'Writing seed file: {seed_path}')
-                with open(seed_path, 'wb') as f:
-                    f.write(seed_data)
-            finally:
-                os.umask(old_umask)
+                fd = os.open(
+                    seed_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+                )
+            except FileExistsError:
+                errmsg = f'Attempting to reinitialize existing seed: {str(self.seed_path)}'
+                raise InitFailure(errmsg) from None
+            with os.fdopen(fd, 'wb') as f:
+                f.write(seed_data)
 
             # Verify/set file permissions
             current_mode = stat.S_IMODE(os.stat(seed_path).st_mode)
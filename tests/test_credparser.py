@@ -5,10 +5,14 @@ import pytest
 
 from credparser import CredParser
 from credparser import mutators
+from credparser.seed import MasterSeed
 from credparser.errors import *
 from credparser.config import CredParserConfig, load_config, config
+from credparser.config import _read_config_file
 from pathlib import Path
 import shutil
+import stat
+import sys
 
 # Set a test-specific path for the master_seed file
 TEST_SEED_PATH = Path(__file__).parent.parent / 'test_.credparser' / 'master.seed'
@@ -17,6 +21,17 @@ if TEST_SEED_PATH.parent.exists():
     shutil.rmtree(TEST_SEED_PATH.parent)
 
 
+@pytest.fixture(scope="module")
+def prebuilt_parser(tmp_path_factory):
+    '''
+    Shared user/password parser for tests that only read its credentials.
+
+    Uses its own seed so tests removing TEST_SEED_PATH can't invalidate it.
+    '''
+    seed_path = tmp_path_factory.mktemp('prebuilt') / 'master.seed'
+    return CredParser(username="user", password="password", seed_path=seed_path)
+
+
 def test_credparser_decode_fail_with_no_master():
     # Make sure a decode with no master.seed file fails
     if TEST_SEED_PATH.parent.exists():
@@ -51,14 +66,67 @@ def test_credparser_init_empty_username_and_password():
     assert parser.credentials is not None
 
 
-def test_credparser_load_credentials():
-    parser1 = CredParser(username="user", password="password", seed_path=TEST_SEED_PATH)
-    encoded_creds = parser1.credentials
-    parser2 = CredParser(seed_path=TEST_SEED_PATH)
+def test_credparser_load_credentials(prebuilt_parser):
+    encoded_creds = prebuilt_parser.credentials
+    parser2 = CredParser(seed_path=prebuilt_parser.seed_path)
     parser2.load(encoded_creds)
     assert parser2.username == "user"
     assert parser2.password == "password"
 
+def test_credparser_decodes_once(monkeypatch):
+    # username/password/repr should be served from the decode done at init
+    import credparser.credparser as credparser_module
+    calls = []
+    original = credparser_module._decode_credentials
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+    monkeypatch.setattr(credparser_module, '_decode_credentials', counting_decode)
+
+    encoded = CredParser(username="user", password="password", seed_path=TEST_SEED_PATH)
+    parser = CredParser(credentials=encoded.credentials, seed_path=TEST_SEED_PATH)
+    calls.clear()
+    for _ in range(3):
+        assert parser.username == "user"
+        assert parser.password == "password"
+    repr(parser)
+    assert calls == []
+
+def test_credparser_load_replaces_decoded_values():
+    parser = CredParser(username="user", password="password", seed_path=TEST_SEED_PATH)
+    other = CredParser(username="other", password="secret", seed_path=TEST_SEED_PATH)
+    parser.load(other.credentials)
+    assert parser.username == "other"
+    assert parser.password == "secret"
+
+def test_credparser_bulk_decode():
+    pairs = [("user1", "password1"), ("user2", ""), ("", "password3")]
+    encoded = [
+        CredParser(username=u, password=p, seed_path=TEST_SEED_PATH).credentials
+        for u, p in pairs
+    ]
+    assert CredParser.bulk_decode(encoded, seed_path=TEST_SEED_PATH) == pairs
+
+def test_credparser_bulk_decode_invalid_fails(prebuilt_parser):
+    with pytest.raises(DecodeFailure):
+        CredParser.bulk_decode(
+            [prebuilt_parser.credentials, "invalid-string"],
+            seed_path=prebuilt_parser.seed_path
+        )
+
+def test_credparser_bulk_encode():
+    pairs = [("user1", "password1"), ("user2", ""), ("", "password3")]
+    encoded = CredParser.bulk_encode(pairs, seed_path=TEST_SEED_PATH)
+    assert len(set(encoded)) == len(pairs)
+    assert CredParser.bulk_decode(encoded, seed_path=TEST_SEED_PATH) == pairs
+
+def test_credparser_bulk_encode_invalid_fails():
+    with pytest.raises(UsageError):
+        CredParser.bulk_encode(
+            [("user", "password"), ("üser", "password")],
+            seed_path=TEST_SEED_PATH
+        )
+
 def test_credparser_reset_credentials():
     parser = CredParser(username="user", password="password", seed_path=TEST_SEED_PATH)
     original_credentials = parser.credentials
@@ -79,6 +147,13 @@ def test_credparser_custom_config():
     assert cfg.max_hash_rounds == 56
     assert cfg.min_hash_rounds == 12
 
+def test_credparser_config_file_formatting():
+    # Blank lines, indented comments, quoting and key case are tolerated
+    cfg = load_config(config_file=Path(__file__).parent / 'dot_config_test_format')
+    assert cfg.salt_len == 16
+    assert cfg.max_hash_rounds == 30
+    assert cfg.min_hash_rounds == 5
+
 def test_credparser_config_file_missing():
     cfg = load_config(config_file=Path(__file__) / 'bad_file_path')
     assert cfg.salt_len is not None
@@ -135,6 +210,11 @@ def test_credparser_load_invalid_credentials():
     with pytest.raises(DecodeFailure):
         parser.load("invalid-string")
 
+def test_credparser_load_truncated_credentials_fails(prebuilt_parser):
+    parser = CredParser(seed_path=prebuilt_parser.seed_path)
+    with pytest.raises(DecodeFailure):
+        parser.load(prebuilt_parser.credentials[:-1])
+
 def test_credparser_readonly_attribute_username():
     parser = CredParser(seed_path=TEST_SEED_PATH)
     with pytest.raises(AttributeError):
@@ -150,14 +230,73 @@ def test_credparser_readonly_attribute_credentials():
     with pytest.raises(AttributeError):
         parser.credentials = "invalid-string"
 
+def test_credparser_readonly_attribute_signer():
+    parser = CredParser(seed_path=TEST_SEED_PATH)
+    with pytest.raises(AttributeError):
+        parser.signer = "signer"
+
+def test_credparser_readonly_attribute_seed_path():
+    parser = CredParser(seed_path=TEST_SEED_PATH)
+    with pytest.raises(AttributeError):
+        parser.seed_path = TEST_SEED_PATH
+
+def test_credparser_load_trailing_newline(prebuilt_parser):
+    credentials = prebuilt_parser.credentials + "\n"
+    loaded = CredParser(credentials=credentials, seed_path=prebuilt_parser.seed_path)
+    assert loaded.username == "user"
+    assert loaded.password == "password"
+
+def test_credparser_load_misplaced_padding_fails(prebuilt_parser):
+    credentials = prebuilt_parser.credentials
+    salt_len = config.salt_len
+    malformed = credentials[:salt_len] + "=" + credentials[salt_len:]
+    parser = CredParser(seed_path=prebuilt_parser.seed_path)
+    with pytest.raises(DecodeFailure):
+        parser.load(malformed)
+
+def test_credparser_load_invalid_keeps_credentials():
+    parser = CredParser(username="user", password="password", seed_path=TEST_SEED_PATH)
+    original_credentials = parser.credentials
+    with pytest.raises(DecodeFailure):
+        parser.load("invalid-string")
+    assert parser.credentials == original_credentials
+    assert parser.username == "user"
+
 def test_credparser_config_salt_len_fails():
     with pytest.raises(ConfigError):
         load_config(config_file=Path(__file__).parent / 'dot_config_test_salt')
 
+def test_credparser_invalid_config_raises_config_error(monkeypatch, tmp_path):
+    # An invalid .config must surface as ConfigError, not a wrapped failure
+    config_module = sys.modules['credparser.config']
+    seed_path = tmp_path / 'master.seed'
+    encoded = CredParser(username="user", password="password", seed_path=seed_path)
+    monkeypatch.setattr(
+        config_module, 'CREDPARSER_CONFIG_FILE',
+        Path(__file__).parent / 'dot_config_test_salt'
+    )
+    monkeypatch.setattr(config_module, '_config', None)
+    new_seed_path = tmp_path / 'new' / 'master.seed'
+    with pytest.raises(ConfigError):
+        CredParser(username="user", password="password", seed_path=new_seed_path)
+    with pytest.raises(ConfigError):
+        CredParser.bulk_encode([("user", "password")], seed_path=new_seed_path)
+    assert not new_seed_path.exists()
+    with pytest.raises(ConfigError):
+        CredParser(credentials=encoded.credentials, seed_path=seed_path)
+    with pytest.raises(ConfigError):
+        CredParser.bulk_decode([encoded.credentials], seed_path=seed_path)
+
 def test_credparser_config_min_hash_rounds_fails():
     with pytest.raises(ConfigError):
         load_config(config_file=Path(__file__).parent / 'dot_config_test_min_hash')
 
+def test_credparser_config_negative_hash_rounds_fails():
+    config_file = Path(__file__).parent / 'dot_config_test_negative_hash'
+    assert _read_config_file(config_file)['min_hash_rounds'] == -3
+    with pytest.raises(ConfigError):
+        load_config(config_file=config_file)
+
 def test_credparser_config_min_higher_than_max_hash_rounds_fails():
     with pytest.raises(ConfigError):
         load_config(config_file=Path(__file__).parent / 'dot_config_test_minmax_hash')
@@ -231,6 +370,91 @@ def test_credparser_reset_with_custom_signer():
     assert parser.password == "newpassword"
     assert parser.signer == "signer_b"
 
+def test_credparser_reset_none_clears(tmp_path):
+    seed_path = tmp_path / 'master.seed'
+    parser = CredParser(username="user", password="password", seed_path=seed_path)
+    parser.reset(username=None, password=None, signer="signer_b")
+    assert parser.credentials is None
+    assert parser.username is None
+    assert parser.password is None
+    assert parser.signer == "signer_b"
+    assert repr(parser) == repr(CredParser(seed_path=seed_path))
+
+def test_credparser_reset_none_skips_seed_init(tmp_path):
+    seed_path = tmp_path / 'master.seed'
+    parser = CredParser(seed_path=seed_path)
+    parser.reset(username=None, password=None)
+    assert not seed_path.exists()
+
+def test_credparser_bulk_encode_none_pair_fails(tmp_path):
+    seed_path = tmp_path / 'master.seed'
+    with pytest.raises(UsageError):
+        CredParser.bulk_encode([("user", "password"), (None, None)], seed_path=seed_path)
+    assert not seed_path.exists()
+
+def test_credparser_reset_username_only_fails():
+    parser = CredParser(username="user", password="password", seed_path=TEST_SEED_PATH)
+    with pytest.raises(UsageError):
+        parser.reset(username="newuser", password=None)
+
+def test_credparser_reset_non_ascii_fails():
+    parser = CredParser(username="user", password="password", seed_path=TEST_SEED_PATH)
+    original_credentials = parser.credentials
+    with pytest.raises(UsageError):
+        parser.reset(username="user", password="pass\u00e9")
+    assert parser.credentials == original_credentials
+
+def test_credparser_reset_credentials_decode():
+    # Credentials produced by reset() should decode in a fresh instance
+    parser = CredParser(username="user", password="password", seed_path=TEST_SEED_PATH)
+    parser.reset(username="newuser", password="newpassword", signer="signer_b")
+    decoded = CredParser(
+        credentials=parser.credentials,
+        signer="signer_b",
+        seed_path=TEST_SEED_PATH
+    )
+    assert decoded.username == "newuser"
+    assert decoded.password == "newpassword"
+
+def test_mutators_binflip_reverses_bits():
+    for value in range(256):
+        expected = int('{:08b}'.format(value)[::-1], 2)
+        assert mutators.binflip(value) == expected
+        assert mutators.BITREV_TABLE[value] == expected
+
+def test_package_dir_lists_lazy_attrs_once():
+    import credparser
+    credparser.make_credentials
+    names = dir(credparser)
+    assert names.count('make_credentials') == 1
+    assert names.count('config') == 1
+
+def test_masterseed_reload(tmp_path):
+    seed_path = tmp_path / 'master.seed'
+    master_seed = MasterSeed(allow_init=True, seed_path=seed_path)
+    original = master_seed.seed
+    seed_path.write_bytes(b'\x01' * (len(original) + 1))
+    # Held value is served until reload() is called
+    assert master_seed.seed == original
+    master_seed.reload()
+    assert master_seed.seed == b'\x01' * (len(original) + 1)
+
+def test_key_cache_keyed_on_seed_digest(tmp_path):
+    seed_path = tmp_path / 'master.seed'
+    CredParser(username="user", password="password", seed_path=seed_path)
+    master_seed = MasterSeed(allow_init=False, seed_path=seed_path)
+    assert len(master_seed.digest) == 16
+    cache_keys = list(mutators._KEY_CACHE)
+    assert any(key[0] == master_seed.digest for key in cache_keys)
+    assert all(master_seed.seed not in key for key in cache_keys)
+
+def test_masterseed_create_refuses_existing(tmp_path):
+    seed_path = tmp_path / 'master.seed'
+    master_seed = MasterSeed(allow_init=True, seed_path=seed_path)
+    assert stat.S_IMODE(seed_path.stat().st_mode) == 0o600
+    with pytest.raises(InitFailure):
+        master_seed._create_seed_file()
+
 
 # Cleanup fixture - runs after all tests complete
 @pytest.fixture(scope="module", autouse=True)